@@ -5,20 +5,45 @@ Generates a comprehensive set of TDMS test files covering various use cases,
 along with a JSON manifest describing expected values for each file.
 
 Usage:
-    uv run python generate_tdms_test_files.py [output_directory]
+    uv run python generate_tdms_test_files.py [output_directory] [--bulk]
+        [--tdms-only] [--skip-existing]
+
+With --bulk, the .tdms files are stored in a single uncompressed
+fixtures.zip in the output directory instead of being written one by one.
+With --tdms-only, only the .tdms files are written and no manifest is built.
+With --skip-existing, .tdms files already in the output directory are left
+as they are; use it only when the generators haven't changed since they were
+written.
 
 Outputs:
     - Multiple .tdms test files
     - manifest.json - JSON file describing all tests and expected values
+
+Manifest version 1.2 stores each test's channels column-wise: "channels" is
+an object with one array per field ("group", "channel", "dataType", ...) and
+an entry per channel. Finite float64 channels larger than BASE64_THRESHOLD
+bytes have "dataB64" (base64 of the little-endian raw bytes) and "encoding":
+"base64-le" in place of "data".
 """
 
-import json
+import argparse
+import base64
+import functools
+import io
+import math
+import mmap
+import os
 import sys
+import threading
 import typing as t
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import numpy as np
+import orjson
 from nptdms import ChannelObject, GroupObject, RootObject, TdmsWriter
 
 # =============================================================================
@@ -26,86 +51,217 @@ from nptdms import ChannelObject, GroupObject, RootObject, TdmsWriter
 # =============================================================================
 
 
-def numpy_to_python(obj: t.Any) -> t.Any:
-    """Convert numpy types to Python native types for JSON serialization."""
-    if isinstance(obj, np.ndarray):
-        return numpy_array_to_list(obj)
-    elif isinstance(obj, (np.integer, np.int8, np.int16, np.int32, np.int64)):
-        return int(obj)
-    elif isinstance(
-        obj, (np.unsignedinteger, np.uint8, np.uint16, np.uint32, np.uint64)
-    ):
-        return int(obj)
-    elif isinstance(obj, (np.floating, np.float32, np.float64)):
-        if np.isnan(obj):
-            return "NaN"
-        elif np.isinf(obj):
-            return "Inf" if obj > 0 else "-Inf"
-        return float(obj)
-    elif isinstance(obj, (np.complexfloating, np.complex64, np.complex128)):
-        return {"real": float(obj.real), "imag": float(obj.imag)}
+def _float_conv(obj: np.floating) -> float | str:
+    value = float(obj)
+    if math.isfinite(value):
+        return value
+    elif math.isnan(value):
+        return "NaN"
+    return "Inf" if value > 0 else "-Inf"
+
+
+def _complex_conv(obj: np.complexfloating) -> dict:
+    return {"real": float(obj.real), "imag": float(obj.imag)}
+
+
+def _array_conv(obj: np.ndarray) -> np.ndarray | list:
+    return numpy_array_passthrough(obj)
+
+
+# Exact-type dispatch for the common cases, so the hot path is a single dict
+# lookup rather than a chain of isinstance checks.
+_CONVERTERS: dict[type, t.Callable[[t.Any], t.Any]] = {
+    np.ndarray: _array_conv,
+    np.int8: int,
+    np.int16: int,
+    np.int32: int,
+    np.int64: int,
+    np.uint8: int,
+    np.uint16: int,
+    np.uint32: int,
+    np.uint64: int,
+    np.float32: _float_conv,
+    np.float64: _float_conv,
+    np.complex64: _complex_conv,
+    np.complex128: _complex_conv,
+    np.datetime64: str,
+    datetime: datetime.isoformat,
+}
+
+# JSON-native types that can be returned unchanged.
+_NATIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Fallback for any other numpy scalar, keyed on dtype.kind.
+_KIND_CONVERTERS: dict[str, t.Callable[[t.Any], t.Any]] = {
+    "i": int,
+    "u": int,
+    "f": _float_conv,
+    "c": _complex_conv,
+    "M": str,
+}
+
+
+def _convert_leaf(obj: t.Any) -> t.Any:
+    """Convert a single non-container value."""
+    conv = _CONVERTERS.get(type(obj))
+    if conv is not None:
+        return conv(obj)
+    elif isinstance(obj, np.generic):
+        conv = _KIND_CONVERTERS.get(obj.dtype.kind)
+        if conv is not None:
+            return conv(obj)
+    elif isinstance(obj, np.ndarray):
+        return numpy_array_passthrough(obj)
     elif isinstance(obj, datetime):
         return obj.isoformat()
-    elif isinstance(obj, np.datetime64):
-        return str(obj)
-    elif isinstance(obj, dict):
-        return {k: numpy_to_python(v) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [numpy_to_python(item) for item in obj]
     return obj
 
 
+def numpy_to_python(obj: t.Any) -> t.Any:
+    """Convert numpy types to Python native types for JSON serialization."""
+    if type(obj) in _NATIVE_TYPES:
+        return obj
+
+    # Walk nested dicts/lists with an explicit stack of (container, key, value)
+    # slots to fill in, rather than recursing once per level.
+    root = [obj]
+    stack: deque[tuple[t.Any, t.Any, t.Any]] = deque([(root, 0, obj)])
+    while stack:
+        parent, key, value = stack.pop()
+        if type(value) in _NATIVE_TYPES:
+            continue
+        elif isinstance(value, dict):
+            out = dict(value)
+            parent[key] = out
+            stack.extend((out, k, v) for k, v in value.items())
+        elif isinstance(value, (list, tuple)):
+            out = list(value)
+            parent[key] = out
+            stack.extend((out, i, v) for i, v in enumerate(value))
+        else:
+            parent[key] = _convert_leaf(value)
+    return root[0]
+
+
 def numpy_array_to_list(arr: np.ndarray) -> list:
     """Convert numpy array to list, handling special float values."""
-    result = []
-    for item in arr:
-        if isinstance(item, (np.floating, float)):
-            if np.isnan(item):
-                result.append("NaN")
-            elif np.isinf(item):
-                result.append("Inf" if item > 0 else "-Inf")
-            else:
-                result.append(float(item))
-        elif isinstance(item, np.complexfloating):
-            result.append({"real": float(item.real), "imag": float(item.imag)})
-        elif isinstance(item, (np.integer, np.unsignedinteger)):
-            result.append(int(item))
-        elif isinstance(item, (np.datetime64, datetime)):
-            result.append(str(item))
-        elif isinstance(item, (bytes, np.bytes_)):
-            result.append(item.decode("utf-8"))
-        else:
-            result.append(item)
+    kind = arr.dtype.kind
+    if kind in "iuU":
+        return arr.tolist()
+    elif kind == "c":
+        return [
+            {"real": real, "imag": imag}
+            for real, imag in zip(arr.real.tolist(), arr.imag.tolist(), strict=True)
+        ]
+    elif kind == "M":
+        return arr.astype(str).tolist()
+    elif kind == "f":
+        result = arr.tolist()
+        if np.isfinite(arr).all():
+            return result
+        for i in np.flatnonzero(np.isnan(arr)):
+            result[i] = "NaN"
+        for i in np.flatnonzero(np.isposinf(arr)):
+            result[i] = "Inf"
+        for i in np.flatnonzero(np.isneginf(arr)):
+            result[i] = "-Inf"
+        return result
+
+    # Object and bytes arrays still need converting element by element.
+    result = [None] * len(arr)
+    for i, item in enumerate(arr):
+        conv = _ITEM_CONVERTERS.get(type(item))
+        result[i] = conv(item) if conv is not None else _convert_item(item)
     return result
 
 
-def get_dtype_string(arr: np.ndarray) -> str:
-    """Get a standardized dtype string for the manifest."""
-    dtype = arr.dtype
-    dtype_map = {
-        "int8": "int8",
-        "int16": "int16",
-        "int32": "int32",
-        "int64": "int64",
-        "uint8": "uint8",
-        "uint16": "uint16",
-        "uint32": "uint32",
-        "uint64": "uint64",
-        "float32": "float32",
-        "float64": "float64",
-        "complex64": "complex64",
-        "complex128": "complex128",
-    }
-
+def _convert_item(item: t.Any) -> t.Any:
+    """Convert an array element whose exact type is not in _ITEM_CONVERTERS."""
+    if isinstance(item, (np.floating, float)):
+        return _float_conv(item)
+    elif isinstance(item, np.complexfloating):
+        return _complex_conv(item)
+    elif isinstance(item, (np.integer, np.unsignedinteger)):
+        return int(item)
+    elif isinstance(item, (np.datetime64, datetime)):
+        return str(item)
+    elif isinstance(item, (bytes, np.bytes_)):
+        return item.decode("utf-8")
+    return item
+
+
+def _decode_utf8(item: bytes) -> str:
+    return item.decode("utf-8")
+
+
+# Array elements are converted like scalars, except that datetimes use str()
+# rather than isoformat() and bytes are decoded.
+_ITEM_CONVERTERS: dict[type, t.Callable[[t.Any], t.Any]] = {
+    **{k: v for k, v in _CONVERTERS.items() if k is not np.ndarray},
+    float: _float_conv,
+    datetime: str,
+    bytes: _decode_utf8,
+    np.bytes_: _decode_utf8,
+}
+
+
+def numpy_array_passthrough(arr: np.ndarray) -> np.ndarray | list:
+    """Leave finite numeric arrays as ndarrays for orjson to serialize natively.
+
+    float32 arrays are widened to float64 so the manifest holds the same values
+    as float(item) would; arrays with NaN/Inf, complex, timestamp or string data
+    fall back to numpy_array_to_list. Non-contiguous views are copied into a
+    contiguous buffer, since orjson only serializes C-contiguous arrays itself.
+    """
+    kind = arr.dtype.kind
+    if kind in "iu":
+        return np.ascontiguousarray(arr)
+    if kind == "f" and np.isfinite(arr).all():
+        return np.ascontiguousarray(arr, dtype=np.float64)
+    return numpy_array_to_list(arr)
+
+
+def _orjson_default(obj: t.Any) -> t.Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, np.ndarray):
+        return numpy_array_to_list(obj)
+    converted = numpy_to_python(obj)
+    if converted is obj:
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+    return converted
+
+
+_DTYPE_NAMES = {
+    "int8": "int8",
+    "int16": "int16",
+    "int32": "int32",
+    "int64": "int64",
+    "uint8": "uint8",
+    "uint16": "uint16",
+    "uint32": "uint32",
+    "uint64": "uint64",
+    "float32": "float32",
+    "float64": "float64",
+    "complex64": "complex64",
+    "complex128": "complex128",
+}
+
+
+@functools.cache
+def _dtype_string(dtype: np.dtype) -> str:
     dtype_str = str(dtype)
-    if dtype_str in dtype_map:
-        return dtype_map[dtype_str]
-    elif dtype.kind == "U" or dtype.kind == "S" or dtype.kind == "O":
-        return "string"
+    if dtype_str in _DTYPE_NAMES:
+        return sys.intern(_DTYPE_NAMES[dtype_str])
+    elif dtype.kind in "USO":
+        return sys.intern("string")
     elif dtype.kind == "M":
-        return "timestamp"
-    else:
-        return dtype_str
+        return sys.intern("timestamp")
+    return sys.intern(dtype_str)
+
+
+def get_dtype_string(arr: np.ndarray) -> str:
+    """Get a standardized dtype string for the manifest."""
+    return _dtype_string(arr.dtype)
 
 
 # =============================================================================
@@ -113,239 +269,687 @@ def get_dtype_string(arr: np.ndarray) -> str:
 # =============================================================================
 
 
+_ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+)
+
+
+def _dumps(obj: t.Any) -> bytes:
+    return orjson.dumps(obj, default=_orjson_default, option=_ORJSON_OPTIONS)
+
+
+def channels_to_columns(channels: list[dict]) -> dict[str, list]:
+    """Turn a list of channel dicts into one list per field.
+
+    Fields that only some channels have (such as "statistics") get a None
+    entry for the channels without them.
+    """
+    fields = list(dict.fromkeys(field for ch in channels for field in ch))
+    return {field: [ch.get(field) for ch in channels] for field in fields}
+
+
+def encode_test_entry(test: dict) -> bytes:
+    """Serialize a test for TestManifest.add_entry.
+
+    Channels are stored column-wise, and the entry is nested two levels deep
+    to match the indentation of the surrounding document.
+    """
+    if "channels" in test:
+        test = {**test, "channels": channels_to_columns(test["channels"])}
+    return _dumps(test).replace(b"\n", b"\n    ")
+
+
 class TestManifest:
-    """Collects test metadata for JSON output."""
+    """Streams test metadata to a JSON manifest as each test is added."""
+
+    __slots__ = ("_file", "_pending", "_writer", "count")
+
+    def __init__(self, filepath: Path):
+        self.count = 0
+        self._file = open(filepath, "wb")  # noqa: SIM115 - closed in finalize()
+        header = _dumps(
+            {
+                "version": "1.2",
+                "generated": datetime.now().isoformat(),
+                "description": "TDMS test file manifest with expected values",
+            }
+        )
+        # Drop the closing brace so the tests array can be appended after it.
+        self._file.write(header[: header.rindex(b"\n")])
+        self._file.write(b',\n  "tests": [')
+
+        # Entries are encoded by the caller, since they may refer to arrays
+        # that are reused once the generator returns, but written out on a
+        # single background thread so file I/O overlaps the next generator.
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="manifest-writer"
+        )
+        self._pending: list[Future] = []
+
+    def add_entry(self, entry: bytes):
+        """Append a test already serialized with encode_test_entry."""
+        separator = b",\n    " if self.count else b"\n    "
+        self._pending.append(self._writer.submit(self._file.write, separator + entry))
+        self.count += 1
+
+    def finalize(self):
+        self._writer.shutdown(wait=True)
+        for future in self._pending:
+            future.result()
+        self._pending.clear()
+        self._file.write(b"\n  ]\n}" if self.count else b"]\n}")
+        self._file.close()
+
+
+# Manifest keys shared by every channel and group entry.
+_K_GROUP = sys.intern("group")
+_K_CHANNEL = sys.intern("channel")
+_K_DATA_TYPE = sys.intern("dataType")
+_K_LENGTH = sys.intern("length")
+_K_DATA = sys.intern("data")
+_K_PROPERTIES = sys.intern("properties")
+_K_NAME = sys.intern("name")
+
+
+# Converted properties keyed on id() of the source dict. The source dict is
+# kept alongside the result so its id can't be reused while it is cached.
+_properties_cache: dict[int, tuple[dict, dict]] = {}
+
+
+def convert_properties(properties: dict | None) -> dict:
+    """Convert a properties dict for the manifest, reusing earlier conversions."""
+    if not properties:
+        return {}
+    cached = _properties_cache.get(id(properties))
+    if cached is None or cached[0] is not properties:
+        cached = (properties, numpy_to_python(properties))
+        _properties_cache[id(properties)] = cached
+    return cached[1]
+
+
+_K_ENCODING = sys.intern("encoding")
+_K_DATA_B64 = sys.intern("dataB64")
+
+# Finite float64 channels larger than this many bytes are written to the
+# manifest as base64-encoded little-endian raw bytes rather than a JSON array.
+# Only float64 is encoded this way, as it is the only dtype the fixtures have
+# channels this large in, so the only one the Go tests exercise decoding.
+BASE64_THRESHOLD = 4096
+
+
+def encode_base64_le(data: np.ndarray) -> str:
+    """Encode a float64 array as base64 of its little-endian raw bytes."""
+    le = data.astype(data.dtype.newbyteorder("<"), copy=False)
+    return base64.b64encode(np.ascontiguousarray(le).tobytes()).decode("ascii")
+
+
+def _base64_channel_info(
+    group: str,
+    channel: str,
+    dtype_string: str,
+    data: np.ndarray,
+    properties: dict | None,
+) -> dict:
+    return {
+        _K_GROUP: sys.intern(group),
+        _K_CHANNEL: channel,
+        _K_DATA_TYPE: dtype_string,
+        _K_LENGTH: len(data),
+        _K_ENCODING: "base64-le",
+        _K_DATA_B64: encode_base64_le(data),
+        _K_PROPERTIES: convert_properties(properties),
+    }
 
-    def __init__(self):
-        self.tests: list[dict] = []
 
-    def add_test(self, test: dict):
-        self.tests.append(test)
+def _inline_channel_info(
+    group: str,
+    channel: str,
+    dtype_string: str,
+    length: int,
+    values: np.ndarray | list,
+    properties: dict | None,
+) -> dict:
+    return {
+        _K_GROUP: sys.intern(group),
+        _K_CHANNEL: channel,
+        _K_DATA_TYPE: dtype_string,
+        _K_LENGTH: length,
+        _K_DATA: values,
+        _K_PROPERTIES: convert_properties(properties),
+    }
+
+
+def _use_base64(data: np.ndarray) -> bool:
+    """Whether a channel's data goes in the manifest base64-encoded."""
+    return (
+        data.nbytes > BASE64_THRESHOLD
+        and data.dtype.kind == "f"
+        and data.dtype.itemsize == 8
+        and np.isfinite(data).all()
+    )
+
+
+def _channel_data_info(
+    group: str,
+    channel: str,
+    dtype_string: str,
+    data: np.ndarray,
+    properties: dict | None,
+) -> dict:
+    """Build a channel entry with its data either base64-encoded or inline."""
+    if _use_base64(data):
+        return _base64_channel_info(group, channel, dtype_string, data, properties)
+    return _inline_channel_info(
+        group,
+        channel,
+        dtype_string,
+        len(data),
+        numpy_array_passthrough(data),
+        properties,
+    )
 
-    def to_dict(self) -> dict:
-        return {
-            "version": "1.0",
-            "generated": datetime.now().isoformat(),
-            "description": "TDMS test file manifest with expected values",
-            "tests": self.tests,
-        }
 
-    def save(self, filepath: Path):
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+# Set by --tdms-only. No manifest is written, so the manifest helpers skip
+# building entries and return _SKIPPED_ENTRY instead.
+SKIP_MANIFEST = False
+_SKIPPED_ENTRY: dict = {}
 
 
 def create_channel_info(
     group: str, channel: str, data: np.ndarray, properties: dict | None = None
 ) -> dict:
     """Create channel info dict for manifest."""
-    return {
-        "group": group,
-        "channel": channel,
-        "dataType": get_dtype_string(data),
-        "length": len(data),
-        "data": numpy_to_python(data),
-        "properties": numpy_to_python(properties) if properties else {},
-    }
+    if SKIP_MANIFEST:
+        return _SKIPPED_ENTRY
+    return _channel_data_info(group, channel, get_dtype_string(data), data, properties)
+
+
+@functools.cache
+def _group_info_without_properties(name: str) -> dict:
+    return {_K_NAME: sys.intern(name), _K_PROPERTIES: {}}
 
 
 def create_group_info(name: str, properties: dict | None = None) -> dict:
     """Create group info dict for manifest."""
+    if SKIP_MANIFEST:
+        return _SKIPPED_ENTRY
+    if not properties:
+        # Most groups have no properties, so share one entry per group name.
+        return _group_info_without_properties(name)
     return {
-        "name": name,
-        "properties": numpy_to_python(properties) if properties else {},
+        _K_NAME: sys.intern(name),
+        _K_PROPERTIES: convert_properties(properties),
     }
 
 
+# =============================================================================
+# TEST FILE OUTPUT
+# =============================================================================
+
+TdmsSegment = list[RootObject | GroupObject | ChannelObject]
+
+
+class GeneratedFile(t.NamedTuple):
+    """A test file as returned by a generator, ready to be written out."""
+
+    filename: str
+    segments: list[TdmsSegment]
+    test: dict
+
+
+def _write_preallocated(filepath: Path, data: bytes | memoryview):
+    """Write data to filepath by sizing the file once and copying into a mmap.
+
+    The rendered size is known up front, so the file is extended a single time
+    instead of growing with each write.
+    """
+    with open(filepath, "w+b") as f:
+        if not data:
+            return
+        f.truncate(len(data))
+        with mmap.mmap(f.fileno(), len(data)) as mm:
+            mm[:] = data
+
+
+# Name of the single archive the test files are stored in with --bulk.
+BULK_ARCHIVE_NAME = "fixtures.zip"
+
+
+def _render(generated: GeneratedFile) -> memoryview:
+    """Write a generated file's segments to an in-memory TDMS file.
+
+    Returns a view onto the buffer rather than a bytes copy of it, so the
+    rendered file is only held in memory once.
+    """
+    buffer = io.BytesIO()
+    with TdmsWriter(buffer) as writer:
+        for segment in generated.segments:
+            writer.write_segment(segment)
+    return buffer.getbuffer()
+
+
+def _available_cpus() -> int:
+    """Number of CPUs this process may run on, honouring any affinity mask."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _init_worker(skip_manifest: bool):
+    """Apply the main process's settings in a generator worker process."""
+    global SKIP_MANIFEST
+    SKIP_MANIFEST = skip_manifest
+
+
+class GeneratorResult(t.NamedTuple):
+    """What a generator worker sends back to the main process."""
+
+    filename: str
+    # Serialized manifest entry, or None with --tdms-only.
+    entry: bytes | None
+    # Rendered file, only set when it is to be archived rather than written.
+    rendered: bytes | None
+    # Whether writing was skipped because the file already existed.
+    skipped: bool = False
+
+
+def _generate(
+    generator: t.Callable[[], GeneratedFile],
+    output_dir: Path,
+    in_memory: bool,
+    skip_existing: bool = False,
+) -> GeneratorResult:
+    """Run a generator and write its file, or render it to bytes if in_memory.
+
+    With skip_existing, a file already in output_dir is neither rendered nor
+    rewritten, though its manifest entry is still built. Runs in a worker
+    process, so the TDMS objects themselves are never sent back.
+    """
+    generated = generator()
+    entry = None if SKIP_MANIFEST else encode_test_entry(generated.test)
+    # The cached conversions are only shared within one generator's entry, and
+    # this worker's cache would otherwise grow with every generator it runs.
+    _properties_cache.clear()
+    filepath = output_dir / generated.filename
+    if not in_memory and skip_existing and filepath.exists():
+        return GeneratorResult(generated.filename, entry, None, skipped=True)
+
+    rendered = _render(generated)
+    if in_memory:
+        # Copied once here, since it has to be pickled back to the main process.
+        return GeneratorResult(generated.filename, entry, rendered.tobytes())
+
+    _write_preallocated(filepath, rendered)
+    return GeneratorResult(generated.filename, entry, None)
+
+
+def _emit(
+    output_dir: Path,
+    result: GeneratorResult,
+    manifest: TestManifest | None,
+    archive: zipfile.ZipFile | None = None,
+) -> str:
+    """Add a generated file's entry to the manifest, archiving it if rendered.
+
+    Called on the main process in generator order, so the manifest and archive
+    keep a stable order however the generators were scheduled. Returns the
+    line to report for the file.
+    """
+    if manifest is not None and result.entry is not None:
+        manifest.add_entry(result.entry)
+
+    if archive is not None and result.rendered is not None:
+        archive.writestr(result.filename, result.rendered)
+        return f"Archived: {result.filename}"
+
+    if result.skipped:
+        return f"Skipped (exists): {output_dir / result.filename}"
+
+    return f"Created: {output_dir / result.filename}"
+
+
+# =============================================================================
+# SHARED CONSTANT DATA
+# =============================================================================
+
+
+def _constant(values: list, dtype: type) -> np.ndarray:
+    """Build a read-only array, safe to share between generators."""
+    arr = np.array(values, dtype=dtype)
+    arr.setflags(write=False)
+    return arr
+
+
+def _integer_edges(dtype: type) -> np.ndarray:
+    """Min, zero and max for signed types; zero, midpoint and max for unsigned."""
+    info = np.iinfo(dtype)
+    if info.min < 0:
+        return _constant([info.min, 0, info.max], dtype)
+    return _constant([0, (info.max + 1) // 2, info.max], dtype)
+
+
+INT32_1_TO_3 = _constant([1, 2, 3], np.int32)
+INT32_1_TO_5 = _constant([1, 2, 3, 4, 5], np.int32)
+FLOAT64_1_TO_3 = _constant([1.0, 2.0, 3.0], np.float64)
+FLOAT64_1_TO_5 = _constant([1.0, 2.0, 3.0, 4.0, 5.0], np.float64)
+
+INTEGER_EDGES: dict[type, np.ndarray] = {
+    dtype: _integer_edges(dtype)
+    for dtype in (
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+    )
+}
+
+
+# =============================================================================
+# SYNTHETIC DATA HELPERS
+# =============================================================================
+
+
+_scratch = threading.local()
+
+
+def scratch(n: int) -> np.ndarray:
+    """Return a float64 view of length n onto a reused per-thread buffer.
+
+    The view is only valid until the next call on the same thread, so a
+    generator must have finished with it (written its file and built its
+    manifest entry) before the thread runs another generator.
+    """
+    buffer = getattr(_scratch, "buffer", None)
+    if buffer is None or buffer.shape[0] < n:
+        buffer = _scratch.buffer = np.empty(n, dtype=np.float64)
+    return buffer[:n]
+
+
+def string_array(values: list[str]) -> np.ndarray:
+    """Build an object array holding the given str objects for a string channel.
+
+    nptdms encodes every value twice per segment (once to size it and once to
+    write it). Iterating a fixed-width unicode array creates a new np.str_ on
+    each access, while an object array hands back the stored str objects.
+    """
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
+
+
+def fill_sine(out: np.ndarray, freq: float, dt: float) -> np.ndarray:
+    """Fill a float64 array in place with sin(2*pi*freq*i*dt)."""
+    np.multiply(np.arange(out.shape[0], dtype=np.float64), dt, out=out)
+    np.multiply(out, 2 * np.pi * freq, out=out)
+    return np.sin(out, out=out)
+
+
+def summary_statistics(data: np.ndarray) -> dict:
+    """Summarise a large float64 channel for the manifest instead of its data.
+
+    np.std would recompute the mean, so the deviations are taken from the one
+    mean computed here and reduced with a single dot product.
+    """
+    mean = data.mean()
+    deviations = data - mean
+    return {
+        "min": float(data.min()),
+        "max": float(data.max()),
+        "mean": float(mean),
+        "std": math.sqrt(np.dot(deviations, deviations) / data.size),
+        "first10": data[:10].tolist(),
+        "last10": data[-10:].tolist(),
+    }
+
+
+# =============================================================================
+# SCALING PROPERTY HELPERS
+# =============================================================================
+
+
+@functools.cache
+def _scale_key(index: int, suffix: str) -> str:
+    return sys.intern(f"NI_Scale[{index}]_{suffix}")
+
+
+@functools.cache
+def _scale_field_keys(
+    index: int, scale_type: str, name: str, count: int | None
+) -> tuple[str, ...]:
+    """Keys for one scale field: a single key, or count keys for a list value."""
+    suffix = f"{scale_type}_{name}"
+    if count is None:
+        return (_scale_key(index, suffix),)
+    return tuple(_scale_key(index, f"{suffix}[{i}]") for i in range(count))
+
+
+def scale_props(index: int, scale_type: str, **fields: t.Any) -> dict:
+    """Build the NI_Scale[index]_* properties for one scale.
+
+    Each field becomes NI_Scale[index]_<scale_type>_<name>, in the order given.
+    A list value expands into one key per element, suffixed [0], [1], ....
+    """
+    props = {_scale_key(index, "Scale_Type"): scale_type}
+    for name, value in fields.items():
+        if isinstance(value, list):
+            keys = _scale_field_keys(index, scale_type, name, len(value))
+            props.update(zip(keys, value, strict=True))
+        else:
+            (key,) = _scale_field_keys(index, scale_type, name, None)
+            props[key] = value
+    return props
+
+
+# =============================================================================
+# EXPECTED SCALING HELPERS
+# =============================================================================
+
+
+def expected_linear(raw: np.ndarray, slope: float, intercept: float) -> list:
+    """Expected values for a linear scale: slope * raw + intercept."""
+    result = raw.astype(np.float64, copy=False) * slope
+    result += intercept
+    return result.tolist()
+
+
+def expected_polynomial(raw: np.ndarray, coefficients: list[float]) -> list:
+    """Expected values for a polynomial scale, coefficients lowest order first."""
+    return np.polynomial.polynomial.polyval(
+        raw.astype(np.float64, copy=False), np.asarray(coefficients, dtype=np.float64)
+    ).tolist()
+
+
+def expected_table(
+    raw: np.ndarray, scaled_values: list[float], pre_scaled_values: list[float]
+) -> list:
+    """Expected values for a table scale, interpolating and clamping at the ends."""
+    return np.interp(raw, scaled_values, pre_scaled_values).tolist()
+
+
+def expected_chained_linear(raw: np.ndarray, scales: list[tuple[float, float]]) -> list:
+    """Expected values for linear (slope, intercept) scales applied in order."""
+    result = raw.astype(np.float64, copy=False)
+    for slope, intercept in scales:
+        # The multiply makes a new array, so raw itself is never modified.
+        result = result * slope
+        result += intercept
+    return result.tolist()
+
+
 # =============================================================================
 # TEST FILE GENERATORS
 # =============================================================================
 
 
-def generate_simple_single_channel(output_dir: Path, manifest: TestManifest):
+def generate_simple_single_channel() -> GeneratedFile:
     """Test Case 1: Simplest possible TDMS file"""
     filename = "01_simple_single_channel.tdms"
-    filepath = output_dir / filename
-
-    data = np.array([1, 2, 3, 4, 5], dtype=np.int32)
-
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment([ChannelObject("Group", "Channel1", data)])
-
-    manifest.add_test(
-        {
-            "id": 1,
-            "name": "simple_single_channel",
-            "filename": filename,
-            "description": "Simplest TDMS file with single group and channel",
-            "features": ["basic", "int32"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Group")],
-            "channels": [create_channel_info("Group", "Channel1", data)],
-        }
-    )
 
-    print(f"Created: {filepath}")
+    data = INT32_1_TO_5
 
+    segments = [
+        [ChannelObject("Group", "Channel1", data)],
+    ]
+
+    test = {
+        "id": 1,
+        "name": "simple_single_channel",
+        "filename": filename,
+        "description": "Simplest TDMS file with single group and channel",
+        "features": ["basic", "int32"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Group")],
+        "channels": [create_channel_info("Group", "Channel1", data)],
+    }
 
-def generate_multiple_channels_same_group(output_dir: Path, manifest: TestManifest):
+    return GeneratedFile(filename, segments, test)
+
+
+def generate_multiple_channels_same_group() -> GeneratedFile:
     """Test Case 2: Multiple channels in same group"""
     filename = "02_multiple_channels_same_group.tdms"
-    filepath = output_dir / filename
 
     voltage = np.array([1.1, 2.2, 3.3, 4.4, 5.5], dtype=np.float64)
     current = np.array([0.1, 0.2, 0.3, 0.4, 0.5], dtype=np.float64)
     temperature = np.array([20, 21, 22, 23, 24], dtype=np.int32)
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject("Measurements", "Voltage", voltage),
-                ChannelObject("Measurements", "Current", current),
-                ChannelObject("Measurements", "Temperature", temperature),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject("Measurements", "Voltage", voltage),
+            ChannelObject("Measurements", "Current", current),
+            ChannelObject("Measurements", "Temperature", temperature),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 2,
-            "name": "multiple_channels_same_group",
-            "filename": filename,
-            "description": "Single group with multiple channels of different types",
-            "features": ["basic", "float64", "int32", "multiple_channels"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Measurements")],
-            "channels": [
-                create_channel_info("Measurements", "Voltage", voltage),
-                create_channel_info("Measurements", "Current", current),
-                create_channel_info("Measurements", "Temperature", temperature),
-            ],
-        }
-    )
+    test = {
+        "id": 2,
+        "name": "multiple_channels_same_group",
+        "filename": filename,
+        "description": "Single group with multiple channels of different types",
+        "features": ["basic", "float64", "int32", "multiple_channels"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Measurements")],
+        "channels": [
+            create_channel_info("Measurements", "Voltage", voltage),
+            create_channel_info("Measurements", "Current", current),
+            create_channel_info("Measurements", "Temperature", temperature),
+        ],
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_multiple_groups(output_dir: Path, manifest: TestManifest):
+def generate_multiple_groups() -> GeneratedFile:
     """Test Case 3: Multiple groups with channels"""
     filename = "03_multiple_groups.tdms"
-    filepath = output_dir / filename
 
     analog_props = {"Description": "Analog measurements"}
     digital_props = {"Description": "Digital signals"}
 
-    voltage = np.array([1.0, 2.0, 3.0], dtype=np.float64)
+    voltage = FLOAT64_1_TO_3
     current = np.array([0.5, 0.6, 0.7], dtype=np.float64)
     input1 = np.array([0, 1, 0, 1], dtype=np.uint8)
     output1 = np.array([1, 0, 1, 0], dtype=np.uint8)
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                GroupObject("Analog", properties=analog_props),
-                ChannelObject("Analog", "Voltage", voltage),
-                ChannelObject("Analog", "Current", current),
-                GroupObject("Digital", properties=digital_props),
-                ChannelObject("Digital", "Input1", input1),
-                ChannelObject("Digital", "Output1", output1),
-            ]
-        )
+    segments = [
+        [
+            GroupObject("Analog", properties=analog_props),
+            ChannelObject("Analog", "Voltage", voltage),
+            ChannelObject("Analog", "Current", current),
+            GroupObject("Digital", properties=digital_props),
+            ChannelObject("Digital", "Input1", input1),
+            ChannelObject("Digital", "Output1", output1),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 3,
-            "name": "multiple_groups",
-            "filename": filename,
-            "description": "Multiple groups with group-level properties",
-            "features": ["multiple_groups", "group_properties", "float64", "uint8"],
-            "root": {"properties": {}},
-            "groups": [
-                create_group_info("Analog", analog_props),
-                create_group_info("Digital", digital_props),
-            ],
-            "channels": [
-                create_channel_info("Analog", "Voltage", voltage),
-                create_channel_info("Analog", "Current", current),
-                create_channel_info("Digital", "Input1", input1),
-                create_channel_info("Digital", "Output1", output1),
-            ],
-        }
-    )
+    test = {
+        "id": 3,
+        "name": "multiple_groups",
+        "filename": filename,
+        "description": "Multiple groups with group-level properties",
+        "features": ["multiple_groups", "group_properties", "float64", "uint8"],
+        "root": {"properties": {}},
+        "groups": [
+            create_group_info("Analog", analog_props),
+            create_group_info("Digital", digital_props),
+        ],
+        "channels": [
+            create_channel_info("Analog", "Voltage", voltage),
+            create_channel_info("Analog", "Current", current),
+            create_channel_info("Digital", "Input1", input1),
+            create_channel_info("Digital", "Output1", output1),
+        ],
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_all_integer_types(output_dir: Path, manifest: TestManifest):
+def generate_all_integer_types() -> GeneratedFile:
     """Test Case 4: All integer data types"""
     filename = "04_all_integer_types.tdms"
-    filepath = output_dir / filename
 
-    int8_data = np.array([-128, 0, 127], dtype=np.int8)
-    int16_data = np.array([-32768, 0, 32767], dtype=np.int16)
-    int32_data = np.array([-2147483648, 0, 2147483647], dtype=np.int32)
-    int64_data = np.array(
-        [-9223372036854775808, 0, 9223372036854775807], dtype=np.int64
-    )
-    uint8_data = np.array([0, 128, 255], dtype=np.uint8)
-    uint16_data = np.array([0, 32768, 65535], dtype=np.uint16)
-    uint32_data = np.array([0, 2147483648, 4294967295], dtype=np.uint32)
-    uint64_data = np.array(
-        [0, 9223372036854775808, 18446744073709551615], dtype=np.uint64
-    )
+    int8_data = INTEGER_EDGES[np.int8]
+    int16_data = INTEGER_EDGES[np.int16]
+    int32_data = INTEGER_EDGES[np.int32]
+    int64_data = INTEGER_EDGES[np.int64]
+    uint8_data = INTEGER_EDGES[np.uint8]
+    uint16_data = INTEGER_EDGES[np.uint16]
+    uint32_data = INTEGER_EDGES[np.uint32]
+    uint64_data = INTEGER_EDGES[np.uint64]
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject("Integers", "int8", int8_data),
-                ChannelObject("Integers", "int16", int16_data),
-                ChannelObject("Integers", "int32", int32_data),
-                ChannelObject("Integers", "int64", int64_data),
-                ChannelObject("Integers", "uint8", uint8_data),
-                ChannelObject("Integers", "uint16", uint16_data),
-                ChannelObject("Integers", "uint32", uint32_data),
-                ChannelObject("Integers", "uint64", uint64_data),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject("Integers", "int8", int8_data),
+            ChannelObject("Integers", "int16", int16_data),
+            ChannelObject("Integers", "int32", int32_data),
+            ChannelObject("Integers", "int64", int64_data),
+            ChannelObject("Integers", "uint8", uint8_data),
+            ChannelObject("Integers", "uint16", uint16_data),
+            ChannelObject("Integers", "uint32", uint32_data),
+            ChannelObject("Integers", "uint64", uint64_data),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 4,
-            "name": "all_integer_types",
-            "filename": filename,
-            "description": "All integer data types with min/max values",
-            "features": [
-                "data_types",
-                "int8",
-                "int16",
-                "int32",
-                "int64",
-                "uint8",
-                "uint16",
-                "uint32",
-                "uint64",
-            ],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Integers")],
-            "channels": [
-                create_channel_info("Integers", "int8", int8_data),
-                create_channel_info("Integers", "int16", int16_data),
-                create_channel_info("Integers", "int32", int32_data),
-                create_channel_info("Integers", "int64", int64_data),
-                create_channel_info("Integers", "uint8", uint8_data),
-                create_channel_info("Integers", "uint16", uint16_data),
-                create_channel_info("Integers", "uint32", uint32_data),
-                create_channel_info("Integers", "uint64", uint64_data),
-            ],
-        }
-    )
+    test = {
+        "id": 4,
+        "name": "all_integer_types",
+        "filename": filename,
+        "description": "All integer data types with min/max values",
+        "features": [
+            "data_types",
+            "int8",
+            "int16",
+            "int32",
+            "int64",
+            "uint8",
+            "uint16",
+            "uint32",
+            "uint64",
+        ],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Integers")],
+        "channels": [
+            create_channel_info("Integers", "int8", int8_data),
+            create_channel_info("Integers", "int16", int16_data),
+            create_channel_info("Integers", "int32", int32_data),
+            create_channel_info("Integers", "int64", int64_data),
+            create_channel_info("Integers", "uint8", uint8_data),
+            create_channel_info("Integers", "uint16", uint16_data),
+            create_channel_info("Integers", "uint32", uint32_data),
+            create_channel_info("Integers", "uint64", uint64_data),
+        ],
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_all_float_types(output_dir: Path, manifest: TestManifest):
+def generate_all_float_types() -> GeneratedFile:
     """Test Case 5: All floating point data types"""
     filename = "05_all_float_types.tdms"
-    filepath = output_dir / filename
 
     float32_data = np.array(
         [1.5, -2.5, 3.14159, np.inf, -np.inf, np.nan], dtype=np.float32
@@ -356,161 +960,146 @@ def generate_all_float_types(output_dir: Path, manifest: TestManifest):
     float32_sci = np.array([1e-38, 1e38, 1.17549435e-38], dtype=np.float32)
     float64_sci = np.array([1e-308, 1e308, 2.2250738585072014e-308], dtype=np.float64)
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject("Floats", "float32", float32_data),
-                ChannelObject("Floats", "float64", float64_data),
-                ChannelObject("Floats", "float32_scientific", float32_sci),
-                ChannelObject("Floats", "float64_scientific", float64_sci),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject("Floats", "float32", float32_data),
+            ChannelObject("Floats", "float64", float64_data),
+            ChannelObject("Floats", "float32_scientific", float32_sci),
+            ChannelObject("Floats", "float64_scientific", float64_sci),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 5,
-            "name": "all_float_types",
-            "filename": filename,
-            "description": "Float types including special values (inf, NaN)",
-            "features": ["data_types", "float32", "float64", "special_values"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Floats")],
-            "channels": [
-                create_channel_info("Floats", "float32", float32_data),
-                create_channel_info("Floats", "float64", float64_data),
-                create_channel_info("Floats", "float32_scientific", float32_sci),
-                create_channel_info("Floats", "float64_scientific", float64_sci),
-            ],
-        }
-    )
+    test = {
+        "id": 5,
+        "name": "all_float_types",
+        "filename": filename,
+        "description": "Float types including special values (inf, NaN)",
+        "features": ["data_types", "float32", "float64", "special_values"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Floats")],
+        "channels": [
+            create_channel_info("Floats", "float32", float32_data),
+            create_channel_info("Floats", "float64", float64_data),
+            create_channel_info("Floats", "float32_scientific", float32_sci),
+            create_channel_info("Floats", "float64_scientific", float64_sci),
+        ],
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_string_data(output_dir: Path, manifest: TestManifest):
+def generate_string_data() -> GeneratedFile:
     """Test Case 6: String data"""
     filename = "06_string_data.tdms"
-    filepath = output_dir / filename
 
-    ascii_data = np.array(["Hello", "World", "Test", "Data"])
-    unicode_data = np.array(["Héllo", "Wörld", "日本語", "中文"])
-    special_data = np.array(
+    ascii_data = string_array(["Hello", "World", "Test", "Data"])
+    unicode_data = string_array(["Héllo", "Wörld", "日本語", "中文"])
+    special_data = string_array(
         ["Line1\nLine2", "Tab\tSeparated", 'Quote"Test', "Slash\\Path"]
     )
-    empty_data = np.array(["First", "", "Third", ""])
-
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject("Strings", "ascii", ascii_data),
-                ChannelObject("Strings", "unicode", unicode_data),
-                ChannelObject("Strings", "special_chars", special_data),
-                ChannelObject("Strings", "with_empty", empty_data),
-            ]
-        )
+    empty_data = string_array(["First", "", "Third", ""])
 
-    manifest.add_test(
-        {
-            "id": 6,
-            "name": "string_data",
-            "filename": filename,
-            "description": "String data including unicode and special characters",
-            "features": ["data_types", "string", "unicode", "special_chars"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Strings")],
-            "channels": [
-                create_channel_info("Strings", "ascii", ascii_data),
-                create_channel_info("Strings", "unicode", unicode_data),
-                create_channel_info("Strings", "special_chars", special_data),
-                create_channel_info("Strings", "with_empty", empty_data),
-            ],
-        }
-    )
+    segments = [
+        [
+            ChannelObject("Strings", "ascii", ascii_data),
+            ChannelObject("Strings", "unicode", unicode_data),
+            ChannelObject("Strings", "special_chars", special_data),
+            ChannelObject("Strings", "with_empty", empty_data),
+        ],
+    ]
 
-    print(f"Created: {filepath}")
+    test = {
+        "id": 6,
+        "name": "string_data",
+        "filename": filename,
+        "description": "String data including unicode and special characters",
+        "features": ["data_types", "string", "unicode", "special_chars"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Strings")],
+        "channels": [
+            create_channel_info("Strings", "ascii", ascii_data),
+            create_channel_info("Strings", "unicode", unicode_data),
+            create_channel_info("Strings", "special_chars", special_data),
+            create_channel_info("Strings", "with_empty", empty_data),
+        ],
+    }
+
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_timestamp_data(output_dir: Path, manifest: TestManifest):
+def generate_timestamp_data() -> GeneratedFile:
     """Test Case 7: Timestamp data"""
     filename = "07_timestamp_data.tdms"
-    filepath = output_dir / filename
 
     timestamps = np.array(
         [
-            np.datetime64("2020-01-01T00:00:00"),
-            np.datetime64("2021-06-15T12:30:45"),
-            np.datetime64("2022-12-31T23:59:59"),
-            np.datetime64("1970-01-01T00:00:00"),
-            np.datetime64("2030-07-04T18:00:00"),
-        ]
+            "2020-01-01T00:00:00",
+            "2021-06-15T12:30:45",
+            "2022-12-31T23:59:59",
+            "1970-01-01T00:00:00",
+            "2030-07-04T18:00:00",
+        ],
+        dtype="datetime64[s]",
     )
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject("Time", "timestamps", timestamps),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject("Time", "timestamps", timestamps),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 7,
-            "name": "timestamp_data",
-            "filename": filename,
-            "description": "Timestamp data with various datetime values",
-            "features": ["data_types", "timestamp"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Time")],
-            "channels": [
-                create_channel_info("Time", "timestamps", timestamps),
-            ],
-        }
-    )
+    test = {
+        "id": 7,
+        "name": "timestamp_data",
+        "filename": filename,
+        "description": "Timestamp data with various datetime values",
+        "features": ["data_types", "timestamp"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Time")],
+        "channels": [
+            create_channel_info("Time", "timestamps", timestamps),
+        ],
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_complex_data(output_dir: Path, manifest: TestManifest):
+def generate_complex_data() -> GeneratedFile:
     """Test Case 8: Complex number data"""
     filename = "08_complex_data.tdms"
-    filepath = output_dir / filename
 
     complex64_data = np.array([1 + 2j, 3 + 4j, 5 + 6j], dtype=np.complex64)
     complex128_data = np.array(
         [1.5 + 2.5j, 3.5 + 4.5j, 5.5 + 6.5j], dtype=np.complex128
     )
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject("Complex", "complex64", complex64_data),
-                ChannelObject("Complex", "complex128", complex128_data),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject("Complex", "complex64", complex64_data),
+            ChannelObject("Complex", "complex128", complex128_data),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 8,
-            "name": "complex_data",
-            "filename": filename,
-            "description": "Complex number data types",
-            "features": ["data_types", "complex64", "complex128"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Complex")],
-            "channels": [
-                create_channel_info("Complex", "complex64", complex64_data),
-                create_channel_info("Complex", "complex128", complex128_data),
-            ],
-        }
-    )
+    test = {
+        "id": 8,
+        "name": "complex_data",
+        "filename": filename,
+        "description": "Complex number data types",
+        "features": ["data_types", "complex64", "complex128"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Complex")],
+        "channels": [
+            create_channel_info("Complex", "complex64", complex64_data),
+            create_channel_info("Complex", "complex128", complex128_data),
+        ],
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_with_properties(output_dir: Path, manifest: TestManifest):
+def generate_with_properties() -> GeneratedFile:
     """Test Case 9: File, group, and channel properties"""
     filename = "09_with_properties.tdms"
-    filepath = output_dir / filename
 
     root_properties = {
         "name": "Test File",
@@ -532,492 +1121,445 @@ def generate_with_properties(output_dir: Path, manifest: TestManifest):
         "display_name": "Channel 1 Voltage",
     }
 
-    data = np.array([1.0, 2.0, 3.0, 4.0, 5.0], dtype=np.float64)
-
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                RootObject(properties=root_properties),
-                GroupObject("Measurements", properties=group_properties),
-                ChannelObject(
-                    "Measurements", "Voltage", data, properties=channel_properties
-                ),
-            ]
-        )
+    data = FLOAT64_1_TO_5
 
-    manifest.add_test(
-        {
-            "id": 9,
-            "name": "with_properties",
-            "filename": filename,
-            "description": "Properties at root, group, and channel levels",
-            "features": [
-                "properties",
-                "root_properties",
-                "group_properties",
-                "channel_properties",
-            ],
-            "root": {"properties": numpy_to_python(root_properties)},
-            "groups": [create_group_info("Measurements", group_properties)],
-            "channels": [
-                create_channel_info("Measurements", "Voltage", data, channel_properties)
-            ],
-        }
-    )
+    segments = [
+        [
+            RootObject(properties=root_properties),
+            GroupObject("Measurements", properties=group_properties),
+            ChannelObject(
+                "Measurements", "Voltage", data, properties=channel_properties
+            ),
+        ],
+    ]
 
-    print(f"Created: {filepath}")
+    test = {
+        "id": 9,
+        "name": "with_properties",
+        "filename": filename,
+        "description": "Properties at root, group, and channel levels",
+        "features": [
+            "properties",
+            "root_properties",
+            "group_properties",
+            "channel_properties",
+        ],
+        "root": {"properties": numpy_to_python(root_properties)},
+        "groups": [create_group_info("Measurements", group_properties)],
+        "channels": [
+            create_channel_info("Measurements", "Voltage", data, channel_properties)
+        ],
+    }
 
+    return GeneratedFile(filename, segments, test)
 
-def generate_with_linear_scaling(output_dir: Path, manifest: TestManifest):
+
+def generate_with_linear_scaling() -> GeneratedFile:
     """Test Case 10: Linear scaling properties"""
     filename = "10_linear_scaling.tdms"
-    filepath = output_dir / filename
 
     # Linear scaling: scaled = slope * raw + intercept
     # With slope=2.0, intercept=10.0: [1,2,3,4,5] -> [12,14,16,18,20]
-    raw_data = np.array([1, 2, 3, 4, 5], dtype=np.int32)
+    raw_data = INT32_1_TO_5
 
     linear_props = {
         "NI_Scaling_Status": "unscaled",
         "NI_Number_Of_Scales": 1,
-        "NI_Scale[0]_Scale_Type": "Linear",
-        "NI_Scale[0]_Linear_Slope": 2.0,
-        "NI_Scale[0]_Linear_Y_Intercept": 10.0,
-        "NI_Scale[0]_Linear_Input_Source": 0xFFFFFFFF,
+        **scale_props(
+            0, "Linear", Slope=2.0, Y_Intercept=10.0, Input_Source=0xFFFFFFFF
+        ),
         "unit_string": "mV",
     }
 
-    expected_scaled = [12.0, 14.0, 16.0, 18.0, 20.0]
+    expected_scaled = expected_linear(raw_data, 2.0, 10.0)
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject(
-                    "Scaled", "linear_scaled", raw_data, properties=linear_props
-                ),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject("Scaled", "linear_scaled", raw_data, properties=linear_props),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 10,
-            "name": "linear_scaling",
-            "filename": filename,
-            "description": "Linear scaling: scaled = slope * raw + intercept",
-            "features": ["scaling", "linear_scaling"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Scaled")],
-            "channels": [
-                create_channel_info("Scaled", "linear_scaled", raw_data, linear_props)
-            ],
-            "scaling": {
-                "linear_scaled": {
-                    "type": "Linear",
-                    "slope": 2.0,
-                    "intercept": 10.0,
-                    "expectedScaled": expected_scaled,
-                }
-            },
-        }
-    )
+    test = {
+        "id": 10,
+        "name": "linear_scaling",
+        "filename": filename,
+        "description": "Linear scaling: scaled = slope * raw + intercept",
+        "features": ["scaling", "linear_scaling"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Scaled")],
+        "channels": [
+            create_channel_info("Scaled", "linear_scaled", raw_data, linear_props)
+        ],
+        "scaling": {
+            "linear_scaled": {
+                "type": "Linear",
+                "slope": 2.0,
+                "intercept": 10.0,
+                "expectedScaled": expected_scaled,
+            }
+        },
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_with_polynomial_scaling(output_dir: Path, manifest: TestManifest):
+def generate_with_polynomial_scaling() -> GeneratedFile:
     """Test Case 11: Polynomial scaling properties"""
     filename = "11_polynomial_scaling.tdms"
-    filepath = output_dir / filename
 
     # Polynomial: scaled = c0 + c1*x + c2*x^2 + c3*x^3
     # c0=10, c1=1, c2=2, c3=3
     # x=1: 10 + 1 + 2 + 3 = 16
     # x=2: 10 + 2 + 8 + 24 = 44
     # x=3: 10 + 3 + 18 + 81 = 112
-    raw_data = np.array([1, 2, 3], dtype=np.int32)
+    raw_data = INT32_1_TO_3
 
     poly_props = {
         "NI_Number_Of_Scales": 1,
-        "NI_Scale[0]_Scale_Type": "Polynomial",
-        "NI_Scale[0]_Polynomial_Coefficients[0]": 10.0,
-        "NI_Scale[0]_Polynomial_Coefficients[1]": 1.0,
-        "NI_Scale[0]_Polynomial_Coefficients[2]": 2.0,
-        "NI_Scale[0]_Polynomial_Coefficients[3]": 3.0,
+        **scale_props(0, "Polynomial", Coefficients=[10.0, 1.0, 2.0, 3.0]),
     }
 
-    expected_scaled = [16.0, 44.0, 112.0]
+    expected_scaled = expected_polynomial(raw_data, [10.0, 1.0, 2.0, 3.0])
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject(
-                    "Scaled", "polynomial_scaled", raw_data, properties=poly_props
-                ),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject(
+                "Scaled", "polynomial_scaled", raw_data, properties=poly_props
+            ),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 11,
-            "name": "polynomial_scaling",
-            "filename": filename,
-            "description": "Polynomial scaling: scaled = c0 + c1*x + c2*x^2 + c3*x^3",
-            "features": ["scaling", "polynomial_scaling"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Scaled")],
-            "channels": [
-                create_channel_info("Scaled", "polynomial_scaled", raw_data, poly_props)
-            ],
-            "scaling": {
-                "polynomial_scaled": {
-                    "type": "Polynomial",
-                    "coefficients": [10.0, 1.0, 2.0, 3.0],
-                    "expectedScaled": expected_scaled,
-                }
-            },
-        }
-    )
+    test = {
+        "id": 11,
+        "name": "polynomial_scaling",
+        "filename": filename,
+        "description": "Polynomial scaling: scaled = c0 + c1*x + c2*x^2 + c3*x^3",
+        "features": ["scaling", "polynomial_scaling"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Scaled")],
+        "channels": [
+            create_channel_info("Scaled", "polynomial_scaled", raw_data, poly_props)
+        ],
+        "scaling": {
+            "polynomial_scaled": {
+                "type": "Polynomial",
+                "coefficients": [10.0, 1.0, 2.0, 3.0],
+                "expectedScaled": expected_scaled,
+            }
+        },
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_with_thermocouple_scaling(output_dir: Path, manifest: TestManifest):
+def generate_with_thermocouple_scaling() -> GeneratedFile:
     """Test Case 12: Thermocouple scaling"""
     filename = "12_thermocouple_scaling.tdms"
-    filepath = output_dir / filename
 
     # Type K thermocouple voltage in microvolts
     voltage_uv = np.array([0.0, 10.0, 100.0, 1000.0], dtype=np.float64)
 
     type_k_props = {
         "NI_Number_Of_Scales": 1,
-        "NI_Scale[0]_Scale_Type": "Thermocouple",
-        "NI_Scale[0]_Thermocouple_Thermocouple_Type": 10073,
-        "NI_Scale[0]_Thermocouple_Scaling_Direction": 0,
-        "NI_Scale[0]_Thermocouple_Input_Source": 0xFFFFFFFF,
+        **scale_props(
+            0,
+            "Thermocouple",
+            Thermocouple_Type=10073,
+            Scaling_Direction=0,
+            Input_Source=0xFFFFFFFF,
+        ),
     }
 
     # Expected temperatures for Type K (approximate)
     expected_temp = [0.0, 0.251, 2.509, 24.984]
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject(
-                    "Thermocouples", "Type_K", voltage_uv, properties=type_k_props
-                ),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject(
+                "Thermocouples", "Type_K", voltage_uv, properties=type_k_props
+            ),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 12,
-            "name": "thermocouple_scaling",
-            "filename": filename,
-            "description": "Thermocouple scaling (Type K, voltage to temperature)",
-            "features": ["scaling", "thermocouple_scaling"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Thermocouples")],
-            "channels": [
-                create_channel_info("Thermocouples", "Type_K", voltage_uv, type_k_props)
-            ],
-            "scaling": {
-                "Type_K": {
-                    "type": "Thermocouple",
-                    "thermocoupleType": 10073,
-                    "direction": "voltage_to_temperature",
-                    "expectedScaled": expected_temp,
-                    "tolerance": 0.01,
-                }
-            },
-        }
-    )
+    test = {
+        "id": 12,
+        "name": "thermocouple_scaling",
+        "filename": filename,
+        "description": "Thermocouple scaling (Type K, voltage to temperature)",
+        "features": ["scaling", "thermocouple_scaling"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Thermocouples")],
+        "channels": [
+            create_channel_info("Thermocouples", "Type_K", voltage_uv, type_k_props)
+        ],
+        "scaling": {
+            "Type_K": {
+                "type": "Thermocouple",
+                "thermocoupleType": 10073,
+                "direction": "voltage_to_temperature",
+                "expectedScaled": expected_temp,
+                "tolerance": 0.01,
+            }
+        },
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_with_rtd_scaling(output_dir: Path, manifest: TestManifest):
+def generate_with_rtd_scaling() -> GeneratedFile:
     """Test Case 13: RTD scaling"""
     filename = "13_rtd_scaling.tdms"
-    filepath = output_dir / filename
 
     # Voltage values (would come from RTD measurement)
     voltage = np.array([0.08, 0.10, 0.12, 0.14, 0.16], dtype=np.float64)
 
     rtd_props = {
         "NI_Number_Of_Scales": 1,
-        "NI_Scale[0]_Scale_Type": "RTD",
-        "NI_Scale[0]_RTD_Current_Excitation": 0.001,
-        "NI_Scale[0]_RTD_R0_Nominal_Resistance": 100.0,
-        "NI_Scale[0]_RTD_A": 0.0039083,
-        "NI_Scale[0]_RTD_B": -5.775e-07,
-        "NI_Scale[0]_RTD_C": -4.183e-12,
-        "NI_Scale[0]_RTD_Lead_Wire_Resistance": 0.0,
-        "NI_Scale[0]_RTD_Resistance_Configuration": 2,
-        "NI_Scale[0]_RTD_Input_Source": 0xFFFFFFFF,
+        **scale_props(
+            0,
+            "RTD",
+            Current_Excitation=0.001,
+            R0_Nominal_Resistance=100.0,
+            A=0.0039083,
+            B=-5.775e-07,
+            C=-4.183e-12,
+            Lead_Wire_Resistance=0.0,
+            Resistance_Configuration=2,
+            Input_Source=0xFFFFFFFF,
+        ),
     }
 
     # Expected temperatures (approximate)
     expected_temp = [-50.77, 0.0, 51.57, 103.94, 157.17]
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject("RTD", "PT100", voltage, properties=rtd_props),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject("RTD", "PT100", voltage, properties=rtd_props),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 13,
-            "name": "rtd_scaling",
-            "filename": filename,
-            "description": "RTD scaling (PT100, 2-wire)",
-            "features": ["scaling", "rtd_scaling"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("RTD")],
-            "channels": [create_channel_info("RTD", "PT100", voltage, rtd_props)],
-            "scaling": {
-                "PT100": {
-                    "type": "RTD",
-                    "resistanceConfiguration": 2,
-                    "r0": 100.0,
-                    "expectedScaled": expected_temp,
-                    "tolerance": 0.1,
-                }
-            },
-        }
-    )
+    test = {
+        "id": 13,
+        "name": "rtd_scaling",
+        "filename": filename,
+        "description": "RTD scaling (PT100, 2-wire)",
+        "features": ["scaling", "rtd_scaling"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("RTD")],
+        "channels": [create_channel_info("RTD", "PT100", voltage, rtd_props)],
+        "scaling": {
+            "PT100": {
+                "type": "RTD",
+                "resistanceConfiguration": 2,
+                "r0": 100.0,
+                "expectedScaled": expected_temp,
+                "tolerance": 0.1,
+            }
+        },
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_with_table_scaling(output_dir: Path, manifest: TestManifest):
+def generate_with_table_scaling() -> GeneratedFile:
     """Test Case 14: Table (lookup) scaling"""
     filename = "14_table_scaling.tdms"
-    filepath = output_dir / filename
 
     # Input values
     raw_data = np.array([0.5, 1.0, 1.5, 2.5, 3.0, 3.5], dtype=np.float64)
 
     table_props = {
         "NI_Number_Of_Scales": 1,
-        "NI_Scale[0]_Scale_Type": "Table",
-        "NI_Scale[0]_Table_Scaled_Values_Size": 3,
-        "NI_Scale[0]_Table_Scaled_Values[0]": 1.0,
-        "NI_Scale[0]_Table_Scaled_Values[1]": 2.0,
-        "NI_Scale[0]_Table_Scaled_Values[2]": 3.0,
-        "NI_Scale[0]_Table_Pre_Scaled_Values_Size": 3,
-        "NI_Scale[0]_Table_Pre_Scaled_Values[0]": 2.0,
-        "NI_Scale[0]_Table_Pre_Scaled_Values[1]": 4.0,
-        "NI_Scale[0]_Table_Pre_Scaled_Values[2]": 8.0,
+        **scale_props(
+            0,
+            "Table",
+            Scaled_Values_Size=3,
+            Scaled_Values=[1.0, 2.0, 3.0],
+            Pre_Scaled_Values_Size=3,
+            Pre_Scaled_Values=[2.0, 4.0, 8.0],
+        ),
     }
 
     # Expected: interpolation between table values
-    expected_scaled = [2.0, 2.0, 3.0, 6.0, 8.0, 8.0]
-
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject(
-                    "Lookup", "table_scaled", raw_data, properties=table_props
-                ),
-            ]
-        )
+    expected_scaled = expected_table(raw_data, [1.0, 2.0, 3.0], [2.0, 4.0, 8.0])
 
-    manifest.add_test(
-        {
-            "id": 14,
-            "name": "table_scaling",
-            "filename": filename,
-            "description": "Table (lookup) scaling with interpolation",
-            "features": ["scaling", "table_scaling"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Lookup")],
-            "channels": [
-                create_channel_info("Lookup", "table_scaled", raw_data, table_props)
-            ],
-            "scaling": {
-                "table_scaled": {
-                    "type": "Table",
-                    "scaledValues": [1.0, 2.0, 3.0],
-                    "preScaledValues": [2.0, 4.0, 8.0],
-                    "expectedScaled": expected_scaled,
-                }
-            },
-        }
-    )
+    segments = [
+        [
+            ChannelObject("Lookup", "table_scaled", raw_data, properties=table_props),
+        ],
+    ]
 
-    print(f"Created: {filepath}")
+    test = {
+        "id": 14,
+        "name": "table_scaling",
+        "filename": filename,
+        "description": "Table (lookup) scaling with interpolation",
+        "features": ["scaling", "table_scaling"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Lookup")],
+        "channels": [
+            create_channel_info("Lookup", "table_scaled", raw_data, table_props)
+        ],
+        "scaling": {
+            "table_scaled": {
+                "type": "Table",
+                "scaledValues": [1.0, 2.0, 3.0],
+                "preScaledValues": [2.0, 4.0, 8.0],
+                "expectedScaled": expected_scaled,
+            }
+        },
+    }
 
+    return GeneratedFile(filename, segments, test)
 
-def generate_chained_scaling(output_dir: Path, manifest: TestManifest):
+
+def generate_chained_scaling() -> GeneratedFile:
     """Test Case 15: Chained (multiple) scaling"""
     filename = "15_chained_scaling.tdms"
-    filepath = output_dir / filename
 
     # Input: [1, 2, 3]
     # Scale 0 (input=raw): y = 1*x + 1 -> [2, 3, 4]
     # Scale 1 (input=scale0): y = 2*x + 2 -> [6, 8, 10]
     # Scale 2 (input=scale1): y = 3*x + 3 -> [21, 27, 33]
-    raw_data = np.array([1.0, 2.0, 3.0], dtype=np.float64)
+    raw_data = FLOAT64_1_TO_3
 
     chained_props = {
         "NI_Scaling_Status": "unscaled",
         "NI_Number_Of_Scales": 3,
-        "NI_Scale[0]_Scale_Type": "Linear",
-        "NI_Scale[0]_Linear_Slope": 1.0,
-        "NI_Scale[0]_Linear_Y_Intercept": 1.0,
-        "NI_Scale[0]_Linear_Input_Source": 0xFFFFFFFF,
-        "NI_Scale[1]_Scale_Type": "Linear",
-        "NI_Scale[1]_Linear_Slope": 2.0,
-        "NI_Scale[1]_Linear_Y_Intercept": 2.0,
-        "NI_Scale[1]_Linear_Input_Source": 0,
-        "NI_Scale[2]_Scale_Type": "Linear",
-        "NI_Scale[2]_Linear_Slope": 3.0,
-        "NI_Scale[2]_Linear_Y_Intercept": 3.0,
-        "NI_Scale[2]_Linear_Input_Source": 1,
+        **scale_props(0, "Linear", Slope=1.0, Y_Intercept=1.0, Input_Source=0xFFFFFFFF),
+        **scale_props(1, "Linear", Slope=2.0, Y_Intercept=2.0, Input_Source=0),
+        **scale_props(2, "Linear", Slope=3.0, Y_Intercept=3.0, Input_Source=1),
     }
 
-    expected_scaled = [21.0, 27.0, 33.0]
+    expected_scaled = expected_chained_linear(
+        raw_data, [(1.0, 1.0), (2.0, 2.0), (3.0, 3.0)]
+    )
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject(
-                    "Chained", "multi_scale", raw_data, properties=chained_props
-                ),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject("Chained", "multi_scale", raw_data, properties=chained_props),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 15,
-            "name": "chained_scaling",
-            "filename": filename,
-            "description": "Multiple chained linear scalings",
-            "features": ["scaling", "chained_scaling"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Chained")],
-            "channels": [
-                create_channel_info("Chained", "multi_scale", raw_data, chained_props)
-            ],
-            "scaling": {
-                "multi_scale": {
-                    "type": "Chained",
-                    "scales": [
-                        {
-                            "type": "Linear",
-                            "slope": 1.0,
-                            "intercept": 1.0,
-                            "inputSource": "raw",
-                        },
-                        {
-                            "type": "Linear",
-                            "slope": 2.0,
-                            "intercept": 2.0,
-                            "inputSource": 0,
-                        },
-                        {
-                            "type": "Linear",
-                            "slope": 3.0,
-                            "intercept": 3.0,
-                            "inputSource": 1,
-                        },
-                    ],
-                    "expectedScaled": expected_scaled,
-                }
-            },
-        }
-    )
+    test = {
+        "id": 15,
+        "name": "chained_scaling",
+        "filename": filename,
+        "description": "Multiple chained linear scalings",
+        "features": ["scaling", "chained_scaling"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Chained")],
+        "channels": [
+            create_channel_info("Chained", "multi_scale", raw_data, chained_props)
+        ],
+        "scaling": {
+            "multi_scale": {
+                "type": "Chained",
+                "scales": [
+                    {
+                        "type": "Linear",
+                        "slope": 1.0,
+                        "intercept": 1.0,
+                        "inputSource": "raw",
+                    },
+                    {
+                        "type": "Linear",
+                        "slope": 2.0,
+                        "intercept": 2.0,
+                        "inputSource": 0,
+                    },
+                    {
+                        "type": "Linear",
+                        "slope": 3.0,
+                        "intercept": 3.0,
+                        "inputSource": 1,
+                    },
+                ],
+                "expectedScaled": expected_scaled,
+            }
+        },
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_multiple_segments(output_dir: Path, manifest: TestManifest):
+def generate_multiple_segments() -> GeneratedFile:
     """Test Case 16: Multiple segments"""
     filename = "16_multiple_segments.tdms"
-    filepath = output_dir / filename
-
-    seg1_data = np.array([1, 2, 3], dtype=np.int32)
-    seg2_data = np.array([4, 5, 6], dtype=np.int32)
-    seg3_data = np.array([7, 8, 9, 10], dtype=np.int32)
-
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment([ChannelObject("Data", "Counter", seg1_data)])
-        writer.write_segment([ChannelObject("Data", "Counter", seg2_data)])
-        writer.write_segment([ChannelObject("Data", "Counter", seg3_data)])
-
-    # Combined data from all segments
-    combined_data = np.concatenate([seg1_data, seg2_data, seg3_data])
-
-    manifest.add_test(
-        {
-            "id": 16,
-            "name": "multiple_segments",
-            "filename": filename,
-            "description": "Data spread across multiple segments",
-            "features": ["segments", "multiple_segments"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Data")],
-            "channels": [create_channel_info("Data", "Counter", combined_data)],
-            "segments": [
-                {"data": numpy_to_python(seg1_data)},
-                {"data": numpy_to_python(seg2_data)},
-                {"data": numpy_to_python(seg3_data)},
-            ],
-        }
-    )
 
-    print(f"Created: {filepath}")
+    # Each segment's data is a view onto the combined data, so the expected
+    # channel data needs no concatenation.
+    combined_data = np.arange(1, 11, dtype=np.int32)
+    seg1_data = combined_data[0:3]
+    seg2_data = combined_data[3:6]
+    seg3_data = combined_data[6:10]
+
+    segments = [
+        [ChannelObject("Data", "Counter", seg1_data)],
+        [ChannelObject("Data", "Counter", seg2_data)],
+        [ChannelObject("Data", "Counter", seg3_data)],
+    ]
+
+    test = {
+        "id": 16,
+        "name": "multiple_segments",
+        "filename": filename,
+        "description": "Data spread across multiple segments",
+        "features": ["segments", "multiple_segments"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Data")],
+        "channels": [create_channel_info("Data", "Counter", combined_data)],
+        "segments": [
+            {"data": seg1_data.tolist()},
+            {"data": seg2_data.tolist()},
+            {"data": seg3_data.tolist()},
+        ],
+    }
+
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_segments_with_different_channels(output_dir: Path, manifest: TestManifest):
+def generate_segments_with_different_channels() -> GeneratedFile:
     """Test Case 17: Different channels in different segments"""
     filename = "17_segments_different_channels.tdms"
-    filepath = output_dir / filename
-
-    chan_a_seg1 = np.array([1.0, 2.0, 3.0], dtype=np.float64)
-    chan_b_seg2 = np.array([10, 20, 30], dtype=np.int32)
-    chan_a_seg3 = np.array([4.0, 5.0], dtype=np.float64)
-    chan_b_seg3 = np.array([40, 50], dtype=np.int32)
-
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment([ChannelObject("Group", "ChannelA", chan_a_seg1)])
-        writer.write_segment([ChannelObject("Group", "ChannelB", chan_b_seg2)])
-        writer.write_segment(
-            [
-                ChannelObject("Group", "ChannelA", chan_a_seg3),
-                ChannelObject("Group", "ChannelB", chan_b_seg3),
-            ]
-        )
 
-    combined_a = np.concatenate([chan_a_seg1, chan_a_seg3])
-    combined_b = np.concatenate([chan_b_seg2, chan_b_seg3])
-
-    manifest.add_test(
-        {
-            "id": 17,
-            "name": "segments_different_channels",
-            "filename": filename,
-            "description": "Different channels appearing in different segments",
-            "features": ["segments", "sparse_channels"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Group")],
-            "channels": [
-                create_channel_info("Group", "ChannelA", combined_a),
-                create_channel_info("Group", "ChannelB", combined_b),
-            ],
-        }
-    )
+    # Per-segment data are views onto each channel's combined data.
+    combined_a = FLOAT64_1_TO_5
+    combined_b = np.array([10, 20, 30, 40, 50], dtype=np.int32)
+    chan_a_seg1 = combined_a[:3]
+    chan_b_seg2 = combined_b[:3]
+    chan_a_seg3 = combined_a[3:]
+    chan_b_seg3 = combined_b[3:]
+
+    segments = [
+        [ChannelObject("Group", "ChannelA", chan_a_seg1)],
+        [ChannelObject("Group", "ChannelB", chan_b_seg2)],
+        [
+            ChannelObject("Group", "ChannelA", chan_a_seg3),
+            ChannelObject("Group", "ChannelB", chan_b_seg3),
+        ],
+    ]
+
+    test = {
+        "id": 17,
+        "name": "segments_different_channels",
+        "filename": filename,
+        "description": "Different channels appearing in different segments",
+        "features": ["segments", "sparse_channels"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Group")],
+        "channels": [
+            create_channel_info("Group", "ChannelA", combined_a),
+            create_channel_info("Group", "ChannelB", combined_b),
+        ],
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_waveform_properties(output_dir: Path, manifest: TestManifest):
+def generate_waveform_properties() -> GeneratedFile:
     """Test Case 18: Waveform properties"""
     filename = "18_waveform_properties.tdms"
-    filepath = output_dir / filename
 
     wf_props = {
         "wf_start_offset": 0.0,
@@ -1028,213 +1570,183 @@ def generate_waveform_properties(output_dir: Path, manifest: TestManifest):
     }
 
     # Generate a 10 Hz sine wave at 1kHz sample rate
-    t = np.arange(0, 1000) * 0.001
-    data = np.sin(2 * np.pi * 10 * t).astype(np.float64)
-
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject("Acquisition", "AI0", data, properties=wf_props),
-            ]
-        )
+    data = fill_sine(scratch(1000), 10, 0.001)
 
-    manifest.add_test(
-        {
-            "id": 18,
-            "name": "waveform_properties",
-            "filename": filename,
-            "description": "DAQmx-style waveform properties",
-            "features": ["waveform", "waveform_properties"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Acquisition")],
-            "channels": [create_channel_info("Acquisition", "AI0", data, wf_props)],
-            "waveform": {
-                "AI0": {
-                    "startOffset": 0.0,
-                    "increment": 0.001,
-                    "samples": 1000,
-                    "expectedTimeRange": [0.0, 0.999],
-                }
-            },
-        }
-    )
+    segments = [
+        [
+            ChannelObject("Acquisition", "AI0", data, properties=wf_props),
+        ],
+    ]
 
-    print(f"Created: {filepath}")
+    test = {
+        "id": 18,
+        "name": "waveform_properties",
+        "filename": filename,
+        "description": "DAQmx-style waveform properties",
+        "features": ["waveform", "waveform_properties"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Acquisition")],
+        "channels": [create_channel_info("Acquisition", "AI0", data, wf_props)],
+        "waveform": {
+            "AI0": {
+                "startOffset": 0.0,
+                "increment": 0.001,
+                "samples": 1000,
+                "expectedTimeRange": [0.0, 0.999],
+            }
+        },
+    }
+
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_empty_channel(output_dir: Path, manifest: TestManifest):
+def generate_empty_channel() -> GeneratedFile:
     """Test Case 19: Empty channel"""
     filename = "19_empty_channel.tdms"
-    filepath = output_dir / filename
 
     empty_data = np.array([], dtype=np.float64)
-    non_empty_data = np.array([1.0, 2.0, 3.0], dtype=np.float64)
-
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject("Group", "EmptyChannel", empty_data),
-                ChannelObject("Group", "NonEmptyChannel", non_empty_data),
-            ]
-        )
+    non_empty_data = FLOAT64_1_TO_3
 
-    manifest.add_test(
-        {
-            "id": 19,
-            "name": "empty_channel",
-            "filename": filename,
-            "description": "Channel with no data",
-            "features": ["edge_case", "empty_channel"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Group")],
-            "channels": [
-                create_channel_info("Group", "EmptyChannel", empty_data),
-                create_channel_info("Group", "NonEmptyChannel", non_empty_data),
-            ],
-        }
-    )
+    segments = [
+        [
+            ChannelObject("Group", "EmptyChannel", empty_data),
+            ChannelObject("Group", "NonEmptyChannel", non_empty_data),
+        ],
+    ]
+
+    test = {
+        "id": 19,
+        "name": "empty_channel",
+        "filename": filename,
+        "description": "Channel with no data",
+        "features": ["edge_case", "empty_channel"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Group")],
+        "channels": [
+            create_channel_info("Group", "EmptyChannel", empty_data),
+            create_channel_info("Group", "NonEmptyChannel", non_empty_data),
+        ],
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_large_data(output_dir: Path, manifest: TestManifest):
+def generate_large_data() -> GeneratedFile:
     """Test Case 20: Large dataset"""
     filename = "20_large_data.tdms"
-    filepath = output_dir / filename
 
-    # Use a seed for reproducibility
-    np.random.seed(42)
-    large_data = np.random.randn(100000).astype(np.float64)
+    # Use a seeded, explicitly pinned bit generator for reproducibility
+    rng = np.random.Generator(np.random.PCG64(42))
+    large_data = rng.standard_normal(100000)
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject("LargeData", "RandomValues", large_data),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject("LargeData", "RandomValues", large_data),
+        ],
+    ]
 
     # Only include summary statistics, not all 100k values
-    manifest.add_test(
-        {
-            "id": 20,
-            "name": "large_data",
-            "filename": filename,
-            "description": "Large dataset (100,000 samples)",
-            "features": ["edge_case", "large_data"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("LargeData")],
-            "channels": [
-                {
-                    "group": "LargeData",
-                    "channel": "RandomValues",
-                    "dataType": "float64",
-                    "length": 100000,
-                    "data": None,  # Too large to include
-                    "properties": {},
-                    "statistics": {
-                        "min": float(np.min(large_data)),
-                        "max": float(np.max(large_data)),
-                        "mean": float(np.mean(large_data)),
-                        "std": float(np.std(large_data)),
-                        "first10": numpy_to_python(large_data[:10]),
-                        "last10": numpy_to_python(large_data[-10:]),
-                    },
-                }
-            ],
-        }
-    )
+    test = {
+        "id": 20,
+        "name": "large_data",
+        "filename": filename,
+        "description": "Large dataset (100,000 samples)",
+        "features": ["edge_case", "large_data"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("LargeData")],
+        "channels": [
+            {
+                "group": "LargeData",
+                "channel": "RandomValues",
+                "dataType": "float64",
+                "length": len(large_data),
+                "data": None,  # Too large to include
+                "properties": {},
+                "statistics": summary_statistics(large_data),
+            }
+        ],
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_special_names(output_dir: Path, manifest: TestManifest):
+def generate_special_names() -> GeneratedFile:
     """Test Case 21: Special characters in names"""
     filename = "21_special_names.tdms"
-    filepath = output_dir / filename
 
-    data1 = np.array([1, 2, 3], dtype=np.int32)
+    data1 = INT32_1_TO_3
     data2 = np.array([4, 5, 6], dtype=np.int32)
     data3 = np.array([7, 8, 9], dtype=np.int32)
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                GroupObject("Group With Spaces"),
-                ChannelObject("Group With Spaces", "Channel-With-Dashes", data1),
-                ChannelObject("Group With Spaces", "Channel_With_Underscores", data2),
-                GroupObject("グループ日本語"),
-                ChannelObject("グループ日本語", "チャンネル", data3),
-            ]
-        )
+    segments = [
+        [
+            GroupObject("Group With Spaces"),
+            ChannelObject("Group With Spaces", "Channel-With-Dashes", data1),
+            ChannelObject("Group With Spaces", "Channel_With_Underscores", data2),
+            GroupObject("グループ日本語"),
+            ChannelObject("グループ日本語", "チャンネル", data3),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 21,
-            "name": "special_names",
-            "filename": filename,
-            "description": "Special characters in group and channel names",
-            "features": ["edge_case", "special_characters", "unicode_names"],
-            "root": {"properties": {}},
-            "groups": [
-                create_group_info("Group With Spaces"),
-                create_group_info("グループ日本語"),
-            ],
-            "channels": [
-                create_channel_info("Group With Spaces", "Channel-With-Dashes", data1),
-                create_channel_info(
-                    "Group With Spaces", "Channel_With_Underscores", data2
-                ),
-                create_channel_info("グループ日本語", "チャンネル", data3),
-            ],
-        }
-    )
+    test = {
+        "id": 21,
+        "name": "special_names",
+        "filename": filename,
+        "description": "Special characters in group and channel names",
+        "features": ["edge_case", "special_characters", "unicode_names"],
+        "root": {"properties": {}},
+        "groups": [
+            create_group_info("Group With Spaces"),
+            create_group_info("グループ日本語"),
+        ],
+        "channels": [
+            create_channel_info("Group With Spaces", "Channel-With-Dashes", data1),
+            create_channel_info("Group With Spaces", "Channel_With_Underscores", data2),
+            create_channel_info("グループ日本語", "チャンネル", data3),
+        ],
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_boolean_data(output_dir: Path, manifest: TestManifest):
+def generate_boolean_data() -> GeneratedFile:
     """Test Case 22: Boolean data"""
     filename = "22_boolean_data.tdms"
-    filepath = output_dir / filename
 
     bool_data = np.array([True, False, True, False, True], dtype=np.bool_)
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject("Digital", "BooleanChannel", bool_data),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject("Digital", "BooleanChannel", bool_data),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 22,
-            "name": "boolean_data",
-            "filename": filename,
-            "description": "Boolean data type",
-            "features": ["data_types", "boolean"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Digital")],
-            "channels": [
-                {
-                    "group": "Digital",
-                    "channel": "BooleanChannel",
-                    "dataType": "boolean",
-                    "length": 5,
-                    "data": [True, False, True, False, True],
-                    "properties": {},
-                }
-            ],
-        }
-    )
+    test = {
+        "id": 22,
+        "name": "boolean_data",
+        "filename": filename,
+        "description": "Boolean data type",
+        "features": ["data_types", "boolean"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Digital")],
+        "channels": [
+            {
+                "group": "Digital",
+                "channel": "BooleanChannel",
+                "dataType": "boolean",
+                "length": len(bool_data),
+                "data": bool_data.tolist(),
+                "properties": {},
+            }
+        ],
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_property_types(output_dir: Path, manifest: TestManifest):
+def generate_property_types() -> GeneratedFile:
     """Test Case 23: Various property data types"""
     filename = "23_property_types.tdms"
-    filepath = output_dir / filename
 
     props = {
         "string_prop": "Hello World",
@@ -1243,80 +1755,72 @@ def generate_property_types(output_dir: Path, manifest: TestManifest):
         "bool_prop": True,
     }
 
-    data = np.array([1.0, 2.0, 3.0], dtype=np.float64)
+    data = FLOAT64_1_TO_3
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject("Group", "Channel", data, properties=props),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject("Group", "Channel", data, properties=props),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 23,
-            "name": "property_types",
-            "filename": filename,
-            "description": "Various property data types",
-            "features": ["properties", "property_types"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Group")],
-            "channels": [create_channel_info("Group", "Channel", data, props)],
-            "propertyTypes": {
-                "string_prop": "string",
-                "int32_prop": "int32",
-                "float64_prop": "float64",
-                "bool_prop": "boolean",
-            },
-        }
-    )
+    test = {
+        "id": 23,
+        "name": "property_types",
+        "filename": filename,
+        "description": "Various property data types",
+        "features": ["properties", "property_types"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Group")],
+        "channels": [create_channel_info("Group", "Channel", data, props)],
+        "propertyTypes": {
+            "string_prop": "string",
+            "int32_prop": "int32",
+            "float64_prop": "float64",
+            "bool_prop": "boolean",
+        },
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_endian_test(output_dir: Path, manifest: TestManifest):
+def generate_endian_test() -> GeneratedFile:
     """Test Case 24: Values for endianness testing"""
     filename = "24_endian_test.tdms"
-    filepath = output_dir / filename
 
     # Values chosen to be obviously different if byte order is wrong
     int16_data = np.array([0x0102, 0x1020, 0x00FF], dtype=np.int16)
     int32_data = np.array([0x01020304, 0x10203040], dtype=np.int32)
     float64_data = np.array([1.0, 256.0, 65536.0], dtype=np.float64)
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject("Endian", "int16_test", int16_data),
-                ChannelObject("Endian", "int32_test", int32_data),
-                ChannelObject("Endian", "float64_test", float64_data),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject("Endian", "int16_test", int16_data),
+            ChannelObject("Endian", "int32_test", int32_data),
+            ChannelObject("Endian", "float64_test", float64_data),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 24,
-            "name": "endian_test",
-            "filename": filename,
-            "description": "Values for testing byte order handling",
-            "features": ["edge_case", "endianness"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Endian")],
-            "channels": [
-                create_channel_info("Endian", "int16_test", int16_data),
-                create_channel_info("Endian", "int32_test", int32_data),
-                create_channel_info("Endian", "float64_test", float64_data),
-            ],
-        }
-    )
+    test = {
+        "id": 24,
+        "name": "endian_test",
+        "filename": filename,
+        "description": "Values for testing byte order handling",
+        "features": ["edge_case", "endianness"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Endian")],
+        "channels": [
+            create_channel_info("Endian", "int16_test", int16_data),
+            create_channel_info("Endian", "int32_test", int32_data),
+            create_channel_info("Endian", "float64_test", float64_data),
+        ],
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_strain_scaling(output_dir: Path, manifest: TestManifest):
+def generate_strain_scaling() -> GeneratedFile:
     """Test Case 25: Strain gauge scaling"""
     filename = "25_strain_scaling.tdms"
-    filepath = output_dir / filename
 
     strain_voltage = np.array(
         [0.0068827, 0.0068036, 0.00688, 0.0068545, 0.0069104], dtype=np.float64
@@ -1324,16 +1828,19 @@ def generate_strain_scaling(output_dir: Path, manifest: TestManifest):
 
     strain_props = {
         "NI_Number_Of_Scales": 1,
-        "NI_Scale[0]_Scale_Type": "Strain",
-        "NI_Scale[0]_Strain_Configuration": 10183,  # Quarter bridge I
-        "NI_Scale[0]_Strain_Poisson_Ratio": 0.3,
-        "NI_Scale[0]_Strain_Gage_Resistance": 350.0,
-        "NI_Scale[0]_Strain_Lead_Wire_Resistance": 0.0,
-        "NI_Scale[0]_Strain_Initial_Bridge_Voltage": 0.0,
-        "NI_Scale[0]_Strain_Gage_Factor": 2.1,
-        "NI_Scale[0]_Strain_Bridge_Shunt_Calibration_Gain_Adjustment": 1.0,
-        "NI_Scale[0]_Strain_Voltage_Excitation": 2.5,
-        "NI_Scale[0]_Strain_Input_Source": 0xFFFFFFFF,
+        **scale_props(
+            0,
+            "Strain",
+            Configuration=10183,  # Quarter bridge I
+            Poisson_Ratio=0.3,
+            Gage_Resistance=350.0,
+            Lead_Wire_Resistance=0.0,
+            Initial_Bridge_Voltage=0.0,
+            Gage_Factor=2.1,
+            Bridge_Shunt_Calibration_Gain_Adjustment=1.0,
+            Voltage_Excitation=2.5,
+            Input_Source=0xFFFFFFFF,
+        ),
     }
 
     # Expected strain values (approximate, from test_scaling.py)
@@ -1345,48 +1852,44 @@ def generate_strain_scaling(output_dir: Path, manifest: TestManifest):
         -1.31627e-03,
     ]
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                ChannelObject(
-                    "Strain", "quarter_bridge", strain_voltage, properties=strain_props
-                ),
-            ]
-        )
+    segments = [
+        [
+            ChannelObject(
+                "Strain", "quarter_bridge", strain_voltage, properties=strain_props
+            ),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 25,
-            "name": "strain_scaling",
-            "filename": filename,
-            "description": "Strain gauge scaling (Quarter Bridge I)",
-            "features": ["scaling", "strain_scaling"],
-            "root": {"properties": {}},
-            "groups": [create_group_info("Strain")],
-            "channels": [
-                create_channel_info(
-                    "Strain", "quarter_bridge", strain_voltage, strain_props
-                )
-            ],
-            "scaling": {
-                "quarter_bridge": {
-                    "type": "Strain",
-                    "configuration": 10183,
-                    "gaugeFactor": 2.1,
-                    "expectedScaled": expected_strain,
-                    "tolerance": 1e-6,
-                }
-            },
-        }
-    )
+    test = {
+        "id": 25,
+        "name": "strain_scaling",
+        "filename": filename,
+        "description": "Strain gauge scaling (Quarter Bridge I)",
+        "features": ["scaling", "strain_scaling"],
+        "root": {"properties": {}},
+        "groups": [create_group_info("Strain")],
+        "channels": [
+            create_channel_info(
+                "Strain", "quarter_bridge", strain_voltage, strain_props
+            )
+        ],
+        "scaling": {
+            "quarter_bridge": {
+                "type": "Strain",
+                "configuration": 10183,
+                "gaugeFactor": 2.1,
+                "expectedScaled": expected_strain,
+                "tolerance": 1e-6,
+            }
+        },
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
-def generate_comprehensive_test(output_dir: Path, manifest: TestManifest):
+def generate_comprehensive_test() -> GeneratedFile:
     """Test Case 26: Comprehensive combined test"""
     filename = "26_comprehensive_test.tdms"
-    filepath = output_dir / filename
 
     root_props = {
         "name": "Comprehensive Test",
@@ -1394,68 +1897,55 @@ def generate_comprehensive_test(output_dir: Path, manifest: TestManifest):
     }
 
     analog_props = {"sample_rate": 1000.0}
-    voltage_data = np.sin(np.linspace(0, 10 * np.pi, 100)).astype(np.float64)
-    current_data = np.cos(np.linspace(0, 10 * np.pi, 100)).astype(np.float64)
+    voltage_props = {"unit_string": "V"}
+    current_props = {"unit_string": "A"}
+    phase = np.linspace(0, 10 * np.pi, 100)
+    voltage_data = np.sin(phase)
+    current_data = np.cos(phase)
 
-    digital_data = np.array(
-        [0, 1, 0, 1, 0, 1, 0, 1] * 12 + [0, 1, 0, 1], dtype=np.uint8
-    )
+    # Alternating 0, 1 for 100 samples
+    digital_data = np.resize(np.array([0, 1], dtype=np.uint8), 100)
 
     counter_data = np.arange(0, 100, dtype=np.uint32)
 
-    with TdmsWriter(str(filepath)) as writer:
-        writer.write_segment(
-            [
-                RootObject(properties=root_props),
-                GroupObject("Analog", properties=analog_props),
-                ChannelObject(
-                    "Analog", "Voltage", voltage_data, properties={"unit_string": "V"}
-                ),
-                ChannelObject(
-                    "Analog", "Current", current_data, properties={"unit_string": "A"}
-                ),
-            ]
-        )
-        writer.write_segment(
-            [
-                GroupObject("Digital"),
-                ChannelObject("Digital", "Trigger", digital_data),
-            ]
-        )
-        writer.write_segment(
-            [
-                GroupObject("Counter"),
-                ChannelObject("Counter", "Count", counter_data),
-            ]
-        )
+    segments = [
+        [
+            RootObject(properties=root_props),
+            GroupObject("Analog", properties=analog_props),
+            ChannelObject("Analog", "Voltage", voltage_data, properties=voltage_props),
+            ChannelObject("Analog", "Current", current_data, properties=current_props),
+        ],
+        [
+            GroupObject("Digital"),
+            ChannelObject("Digital", "Trigger", digital_data),
+        ],
+        [
+            GroupObject("Counter"),
+            ChannelObject("Counter", "Count", counter_data),
+        ],
+    ]
 
-    manifest.add_test(
-        {
-            "id": 26,
-            "name": "comprehensive_test",
-            "filename": filename,
-            "description": "Comprehensive test with multiple groups, segments, and data types",
-            "features": ["comprehensive", "multiple_groups", "multiple_segments"],
-            "root": {"properties": numpy_to_python(root_props)},
-            "groups": [
-                create_group_info("Analog", analog_props),
-                create_group_info("Digital"),
-                create_group_info("Counter"),
-            ],
-            "channels": [
-                create_channel_info(
-                    "Analog", "Voltage", voltage_data, {"unit_string": "V"}
-                ),
-                create_channel_info(
-                    "Analog", "Current", current_data, {"unit_string": "A"}
-                ),
-                create_channel_info("Digital", "Trigger", digital_data),
-                create_channel_info("Counter", "Count", counter_data),
-            ],
-        }
-    )
+    test = {
+        "id": 26,
+        "name": "comprehensive_test",
+        "filename": filename,
+        "description": "Comprehensive test with multiple groups, segments, and data types",
+        "features": ["comprehensive", "multiple_groups", "multiple_segments"],
+        "root": {"properties": numpy_to_python(root_props)},
+        "groups": [
+            create_group_info("Analog", analog_props),
+            create_group_info("Digital"),
+            create_group_info("Counter"),
+        ],
+        "channels": [
+            create_channel_info("Analog", "Voltage", voltage_data, voltage_props),
+            create_channel_info("Analog", "Current", current_data, current_props),
+            create_channel_info("Digital", "Trigger", digital_data),
+            create_channel_info("Counter", "Count", counter_data),
+        ],
+    }
 
-    print(f"Created: {filepath}")
+    return GeneratedFile(filename, segments, test)
 
 
 # =============================================================================
@@ -1463,15 +1953,59 @@ def generate_comprehensive_test(output_dir: Path, manifest: TestManifest):
 # =============================================================================
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate TDMS test files.")
+    parser.add_argument(
+        "output_dir",
+        nargs="?",
+        type=Path,
+        default=Path("testdata"),
+        help="directory to write the test files and manifest to",
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help=f"store the test files in a single {BULK_ARCHIVE_NAME} archive "
+        "instead of writing each one separately",
+    )
+    parser.add_argument(
+        "--tdms-only",
+        action="store_true",
+        help="only write the test files, skipping the manifest",
+    )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="don't rewrite test files already in the output directory; the "
+        "manifest is still rebuilt for every file",
+    )
+    args = parser.parse_args()
+    if args.bulk and args.skip_existing:
+        parser.error("--skip-existing cannot be used with --bulk")
+    return args
+
+
 def main():
-    output_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("testdata")
+    global SKIP_MANIFEST
+
+    args = parse_args()
+    output_dir: Path = args.output_dir
+    SKIP_MANIFEST = args.tdms_only
 
     print(f"Generating TDMS test files in: {output_dir}")
     print("=" * 60)
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    manifest = TestManifest()
+    manifest_path = output_dir / "manifest.json"
+    manifest = None if SKIP_MANIFEST else TestManifest(manifest_path)
+
+    # Uncompressed, so individual files can be extracted cheaply on demand.
+    archive = (
+        zipfile.ZipFile(output_dir / BULK_ARCHIVE_NAME, "w", zipfile.ZIP_STORED)
+        if args.bulk
+        else None
+    )
 
     generators = [
         generate_simple_single_channel,
@@ -1502,22 +2036,55 @@ def main():
         generate_comprehensive_test,
     ]
 
-    for generator in generators:
-        try:
-            generator(output_dir, manifest)
-        except Exception as e:
-            print(f"Error in {generator.__name__}: {e}")
-            import traceback
-
-            traceback.print_exc()
-
-    # Save the manifest
-    manifest_path = output_dir / "manifest.json"
-    manifest.save(manifest_path)
-
+    # Generators are independent and each writes its own file, so run them in
+    # separate processes and record the results in order as they complete.
+    # Worker processes don't see globals set above, so pass them explicitly.
+    with ProcessPoolExecutor(
+        max_workers=min(_available_cpus(), len(generators)),
+        initializer=_init_worker,
+        initargs=(SKIP_MANIFEST,),
+    ) as pool:
+        futures = [
+            pool.submit(
+                _generate,
+                generator,
+                output_dir,
+                archive is not None,
+                args.skip_existing,
+            )
+            for generator in generators
+        ]
+        # Per-file lines are collected and written in one go at the end.
+        log: list[str] = []
+        written = skipped = 0
+        for generator, future in zip(generators, futures, strict=True):
+            try:
+                result = future.result()
+                log.append(_emit(output_dir, result, manifest, archive))
+                if result.skipped:
+                    skipped += 1
+                else:
+                    written += 1
+            except Exception as e:
+                log.append(f"Error in {generator.__name__}: {e}")
+                import traceback
+
+                traceback.print_exc()
+
+    if manifest is not None:
+        manifest.finalize()
+    if archive is not None:
+        archive.close()
+
+    sys.stdout.write("\n".join(log) + "\n")
     print("=" * 60)
-    print(f"Generated {len(generators)} test files")
-    print(f"Manifest saved to: {manifest_path}")
+    print(f"Generated {written} test files")
+    if skipped:
+        print(f"Skipped {skipped} existing test files")
+    if archive is not None:
+        print(f"Test files archived to: {output_dir / BULK_ARCHIVE_NAME}")
+    if manifest is not None:
+        print(f"Manifest saved to: {manifest_path}")
 
 
 if __name__ == "__main__":
@@ -2,7 +2,10 @@ package tdms
 
 import (
 	"bytes"
+	"encoding/base64"
+	"encoding/binary"
 	"encoding/json"
+	"fmt"
 	"math"
 	"math/cmplx"
 	"os"
@@ -37,7 +40,7 @@ type TestCase struct {
 	Features    []string                `json:"features"`
 	Root        RootInfo                `json:"root"`
 	Groups      []GroupInfo             `json:"groups"`
-	Channels    []ChannelInfo           `json:"channels"`
+	Channels    ChannelList             `json:"channels"`
 	Scaling     map[string]ScalingInfo  `json:"scaling,omitempty"`
 	Waveform    map[string]WaveformInfo `json:"waveform,omitempty"`
 	Segments    []SegmentInfo           `json:"segments,omitempty"`
@@ -61,10 +64,76 @@ type ChannelInfo struct {
 	DataType   string         `json:"dataType"`
 	Length     int            `json:"length"`
 	Data       any            `json:"data"` // Can be []any, nil, or other types
+	Encoding   string         `json:"encoding,omitempty"`
+	DataB64    string         `json:"dataB64,omitempty"`
 	Properties map[string]any `json:"properties"`
 	Statistics *Statistics    `json:"statistics,omitempty"`
 }
 
+// ChannelList is the expected channels of a test case. The manifest stores
+// them column-wise, as one array per field with an entry per channel.
+type ChannelList []ChannelInfo
+
+// UnmarshalJSON expands the manifest's channel columns into one ChannelInfo
+// per channel. Optional columns may be absent or hold null for some channels.
+func (c *ChannelList) UnmarshalJSON(data []byte) error {
+	var columns struct {
+		Group      []string         `json:"group"`
+		Channel    []string         `json:"channel"`
+		DataType   []string         `json:"dataType"`
+		Length     []int            `json:"length"`
+		Data       []any            `json:"data"`
+		Encoding   []string         `json:"encoding"`
+		DataB64    []string         `json:"dataB64"`
+		Properties []map[string]any `json:"properties"`
+		Statistics []*Statistics    `json:"statistics"`
+	}
+
+	decoder := json.NewDecoder(bytes.NewReader(data))
+	decoder.UseNumber()
+	if err := decoder.Decode(&columns); err != nil {
+		return err
+	}
+
+	n := len(columns.Channel)
+	for name, length := range map[string]int{
+		"group":    len(columns.Group),
+		"dataType": len(columns.DataType),
+		"length":   len(columns.Length),
+	} {
+		if length != n {
+			return fmt.Errorf("channel column %q has %d entries, expected %d", name, length, n)
+		}
+	}
+
+	*c = make(ChannelList, n)
+	for i := range *c {
+		(*c)[i] = ChannelInfo{
+			Group:      columns.Group[i],
+			Channel:    columns.Channel[i],
+			DataType:   columns.DataType[i],
+			Length:     columns.Length[i],
+			Data:       columnAt(columns.Data, i),
+			Encoding:   columnAt(columns.Encoding, i),
+			DataB64:    columnAt(columns.DataB64, i),
+			Properties: columnAt(columns.Properties, i),
+			Statistics: columnAt(columns.Statistics, i),
+		}
+	}
+
+	return nil
+}
+
+// columnAt returns the i-th entry of an optional column, or the zero value if
+// the column is absent.
+func columnAt[T any](column []T, i int) T {
+	var zero T
+	if i >= len(column) {
+		return zero
+	}
+	return column[i]
+}
+
 // Statistics for large data files where full data isn't included
 type Statistics struct {
 	Min     float64   `json:"min"`
@@ -124,9 +193,65 @@ func loadManifest(t *testing.T, testDataDir string) *Manifest {
 		t.Fatalf("Failed to parse manifest: %v", err)
 	}
 
+	for i := range manifest.Tests {
+		for j := range manifest.Tests[i].Channels {
+			ch := &manifest.Tests[i].Channels[j]
+			if err := decodeBase64Data(ch); err != nil {
+				t.Fatalf("Failed to decode data for %s/%s in %s: %v",
+					ch.Group, ch.Channel, manifest.Tests[i].Filename, err)
+			}
+		}
+	}
+
 	return &manifest
 }
 
+// decodeBase64Data replaces base64-encoded channel data with the equivalent
+// []any of json.Number values, so it compares the same way as inline data.
+func decodeBase64Data(ch *ChannelInfo) error {
+	if ch.Encoding == "" {
+		return nil
+	}
+	if ch.Encoding != "base64-le" {
+		return fmt.Errorf("unknown data encoding %q", ch.Encoding)
+	}
+
+	raw, err := base64.StdEncoding.DecodeString(ch.DataB64)
+	if err != nil {
+		return err
+	}
+
+	// Only float64 channels are written base64-encoded.
+	if ch.DataType != "float64" {
+		return fmt.Errorf("unsupported data type %q for base64 data", ch.DataType)
+	}
+	data, err := decodeFloat64LE(raw, ch.Length)
+	if err != nil {
+		return err
+	}
+
+	ch.Data = data
+	ch.DataB64 = ""
+
+	return nil
+}
+
+func decodeFloat64LE(raw []byte, length int) ([]any, error) {
+	values := make([]float64, length)
+	if size := binary.Size(values); len(raw) != size {
+		return nil, fmt.Errorf("expected %d bytes, got %d", size, len(raw))
+	}
+	if err := binary.Read(bytes.NewReader(raw), binary.LittleEndian, values); err != nil {
+		return nil, err
+	}
+
+	result := make([]any, length)
+	for i, v := range values {
+		result[i] = json.Number(strconv.FormatFloat(v, 'g', -1, 64))
+	}
+	return result, nil
+}
+
 func hasFeature(tc TestCase, feature string) bool {
 	return slices.Contains(tc.Features, feature)
 }